@@ -3,19 +3,23 @@
 
 # ------------------------------ Standard Library Imports ------------------------------
 
-import configparser
-from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import date, datetime
 import fnmatch
 import gc
 import logging
+from operator import itemgetter
 import os
 import re
+import shutil
 import sys
+import threading
 from enum import Enum
 
 # -------------------------------- Third-Party Imports ---------------------------------
 
-import pandas as pd
+import numpy as np
 import pythoncom
 import pytz
 from openpyxl import load_workbook
@@ -31,28 +35,92 @@ logger = logging.getLogger(__name__)
 # ----------------------------------------------------- CONSTANTS ------------------------------------------------------
 
 # Pulled from initialization file
-config = configparser.ConfigParser()
-config.read('Restatement_Process_Config.ini')
+CONFIG_FILE = 'Restatement_Process_Config.ini'
 
-def get_config_value(section, key):
-    value = config.get(section, key, fallback=None)
-    if not value:
-        raise ValueError(f"Missing required config value: [{section}] {key}")
-    return value
+def read_ini_file(path):
+    # Minimal one-pass INI reader: [section] headers, key = value / key: value, ';' and '#' comments
+    sections = {}
+    current = None
 
+    try:
+        with open(path) as ini_file:
+            lines = ini_file.read().splitlines()
+    except OSError:
+        return sections  # Same as ConfigParser.read: a missing file yields no values
+
+    for line in lines:
+        line = line.strip()
+        if not line or line[0] in "#;":
+            continue
+
+        if line[0] == "[" and line[-1] == "]":
+            current = sections.setdefault(line[1:-1].strip(), {})
+            continue
+
+        if current is None:
+            continue
+
+        split_at = min((pos for pos in (line.find("="), line.find(":")) if pos != -1), default=-1)
+        if split_at == -1:
+            continue
+
+        current[line[:split_at].strip().lower()] = line[split_at + 1:].strip()
+
+    return sections
+
+
+@dataclass(frozen=True)
+class Config:
+    # Excel File & Sheet Names
+    excel_file: str
+    automated_sheet: str
+    settings_sheet: str
+    revisions_sheet: str
+
+    # Outlook Mailbox & Folder
+    shared_mailbox: str
+    folder_name: str
 
-# Excel File & Sheet Names
-EXCEL_FILE = get_config_value('EXCEL', 'excel_file')
-AUTOMATED_SHEET = get_config_value('EXCEL', 'automated_sheet')
-SETTINGS_SHEET = get_config_value('EXCEL', 'settings_sheet')
-REVISION_SHEET = get_config_value('EXCEL', 'revisions_sheet')
+    # Directories
+    daily_imported_statements: str
 
-# Outlook Mailbox & Folder
-SHARED_MAILBOX = get_config_value('Outlook', 'shared_mailbox')
-FOLDER_NAME = get_config_value('Outlook', 'folder_name')
+    @classmethod
+    def from_file(cls, path):
+        sections = read_ini_file(path)
 
-#Directories
-BASE_PATH = get_config_value('Directories', 'daily_imported_statements')
+        def get_config_value(section, key):
+            value = sections.get(section, {}).get(key)
+            if not value:
+                raise ValueError(f"Missing required config value: [{section}] {key}")
+            return value
+
+        return cls(
+            excel_file=get_config_value('EXCEL', 'excel_file'),
+            automated_sheet=get_config_value('EXCEL', 'automated_sheet'),
+            settings_sheet=get_config_value('EXCEL', 'settings_sheet'),
+            revisions_sheet=get_config_value('EXCEL', 'revisions_sheet'),
+            shared_mailbox=get_config_value('Outlook', 'shared_mailbox'),
+            folder_name=get_config_value('Outlook', 'folder_name'),
+            daily_imported_statements=get_config_value('Directories', 'daily_imported_statements')
+        )
+
+
+# Read once at import; every later lookup is a plain attribute access
+CONFIG = Config.from_file(CONFIG_FILE)
+
+# Attachment pattern classification
+GLOB_CHARS_RE = re.compile(r'[*?\[]')
+PREFIX_GLOB_RE = re.compile(r'^[^*?\[]+\*$')
+SUFFIX_GLOB_RE = re.compile(r'^\*[^*?\[]+$')
+
+# Worker threads used for SaveAsFile; Outlook serialises COM calls beyond a handful
+SAVE_WORKERS = 4
+
+# Most attachments queued for saving at once; each one keeps its Outlook item open until saved
+MAX_PENDING_SAVES = SAVE_WORKERS * 4
+
+# Characters Windows does not allow in file names
+SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
 
 # ---------------------------------------------------- Enum types ------------------------------------------------------
 
@@ -75,26 +143,14 @@ def get_filter_time(reference_date, hour, minute, timezone="US/Eastern"):
 
 
 def get_prior_business_days(n):
-    reference_date = date.today()
-
-    if n == 0:
-        while reference_date.weekday() >= 5:
-            reference_date -= timedelta(days=1)
-        return reference_date
-
-    business_days_count = 0
-    target_date = reference_date
-
-    while business_days_count < abs(n):
-        target_date -= timedelta(days=1)
-        if target_date.weekday() < 5:
-            business_days_count += 1
+    # n == 0 rolls a weekend back to Friday; otherwise roll forward first so today itself is never counted
+    roll = 'backward' if n == 0 else 'forward'
 
-    return target_date
+    return np.busday_offset(date.today(), -abs(n), roll=roll).item()
 
 
 def make_import_archive_path(reference_date):
-    base_path = BASE_PATH
+    base_path = CONFIG.daily_imported_statements
     yearly_folder = f"{reference_date:%Y}"
     monthly_folder = f"{reference_date:%B}"
     daily_folder = f"COB {reference_date:%m.%d.%Y}"
@@ -111,12 +167,18 @@ class RestatementProcessor:
         self.excel_file = excel_file
         self.wb = None
         self.auto_ws = None
+        self._named_cells = None
         self.mailbox_name = mailbox_name
         self.archive_folder = archive_folder
-        self.mapping_df = None
-        self.mapping_dict = None
+        self.status_col_idx = None
+        self.mapping_idx = None
+        self.save_paths = None
+        self.row_indices = None
         self.folder = None
         self.items = None
+        self.messages_processed = 0
+        self._pending_saves = None
+        self._path_futures = None
         self.excel_doc_updates = None
 
 
@@ -126,9 +188,10 @@ class RestatementProcessor:
             names = ["CBD", "PBD", "P2BD", "Start_Time", "End_Time", "Execution_Time"]
 
         named_cells = {}
+        defined_names = wb.defined_names
 
         for name in names:
-            defined_name = wb.defined_names.get(name)
+            defined_name = defined_names.get(name)
             if defined_name:
                 sheet_name, cell_address = list(defined_name.destinations)[0]
                 sheet = wb[sheet_name]
@@ -141,6 +204,72 @@ class RestatementProcessor:
         return named_cells
 
 
+    @staticmethod
+    def _compile_attachment_patterns(indexes, attachment_patterns):
+        literals = {}
+        prefixes = []
+        suffixes = []
+        regex_positions = []
+        regex_patterns = []
+
+        # Plain names and single leading/trailing wildcards never need the regex engine
+        for pos in indexes:
+            pattern = attachment_patterns[pos]
+            if not GLOB_CHARS_RE.search(pattern):
+                literals.setdefault(pattern, []).append(pos)
+            elif PREFIX_GLOB_RE.match(pattern):
+                prefixes.append((pattern[:-1], pos))
+            elif SUFFIX_GLOB_RE.match(pattern):
+                suffixes.append((pattern[1:], pos))
+            else:
+                regex_positions.append(pos)
+                regex_patterns.append(pattern)
+
+        # One alternation per key lets a single regex scan find the first matching pattern
+        combined = "|".join(f"(?P<m{i}>{fnmatch.translate(pattern)})" for i, pattern in enumerate(regex_patterns))
+
+        # If every pattern ends in a literal extension, attachments with any other extension can be rejected outright
+        extensions = set()
+        for pos in indexes:
+            _, dot, extension = attachment_patterns[pos].rpartition('.')
+            if not dot or GLOB_CHARS_RE.search(extension) or ']' in extension:
+                extensions = None
+                break
+            extensions.add(extension)
+
+        return {
+            'Extensions': frozenset(extensions) if extensions is not None else None,
+            'Literals': literals,
+            'Prefixes': prefixes,
+            'Suffixes': suffixes,
+            'Pattern': re.compile(combined) if regex_patterns else None,
+            'Patterns': [(pos, re.compile(fnmatch.translate(pattern)))
+                         for pos, pattern in zip(regex_positions, regex_patterns)]
+        }
+
+
+    @staticmethod
+    def _find_matches(entry, attachment_name):
+        extensions = entry['Extensions']
+        if extensions is not None and attachment_name.rpartition('.')[2] not in extensions:
+            return []
+
+        hits = list(entry['Literals'].get(attachment_name, ()))
+        hits.extend(pos for prefix, pos in entry['Prefixes'] if attachment_name.startswith(prefix))
+        hits.extend(pos for suffix, pos in entry['Suffixes'] if attachment_name.endswith(suffix))
+
+        found = entry['Pattern'].match(attachment_name) if entry['Pattern'] is not None else None
+        if found is not None:
+            # Later patterns may match the same attachment, so only those after the first hit are rechecked
+            first = int(found.lastgroup[1:])
+            patterns = entry['Patterns']
+            hits.append(patterns[first][0])
+            hits.extend(pos for pos, pattern in patterns[first + 1:] if pattern.match(attachment_name))
+
+        # Positions index the mapping arrays; sorting keeps mapping-row order
+        return sorted(hits)
+
+
     def reset_excel_template(self, cbd, pbd, p2bd, script_start):
         try:
             wb = load_workbook(self.excel_file)
@@ -151,13 +280,15 @@ class RestatementProcessor:
             return
 
         try:
-            auto_ws = wb[AUTOMATED_SHEET]
+            auto_ws = wb[CONFIG.automated_sheet]
             self.auto_ws = auto_ws
         except KeyError as e:
             logger.error(f"Automated sheet not found: {e}")
             return
 
+        # Resolved once here and reused by update_excel_status
         named_cells = RestatementProcessor._get_named_cell_value(wb)
+        self._named_cells = named_cells
 
         named_cells["CBD"].value = cbd.strftime("%Y-%m-%d")
         named_cells["PBD"].value = pbd.strftime("%Y-%m-%d")
@@ -166,48 +297,86 @@ class RestatementProcessor:
 
         logger.info(f"Business dates calculated: CBD={cbd}, PBD={pbd}, P2BD={p2bd}")
 
-        row = 2
-        while auto_ws[f"E{row}"].value is not None:
-            for col in ["E", "F"]:
-                auto_ws[f"{col}{row}"].value = None
-            row += 1
+        # Columns E:F hold the previous run's status; walk existing rows only so no phantom cells are created
+        cleared = 0
+        for cells in auto_ws.iter_rows(min_row=2, max_row=auto_ws.max_row, min_col=5, max_col=6):
+            if any(cell.value is not None for cell in cells):
+                cleared += 1
+            for cell in cells:
+                cell.value = None
 
-        logger.info(f"Status reset completed. Cleared rows: {row - 2}")
+        logger.info(f"Status reset completed. Cleared rows: {cleared}")
 
 
     def build_dictionary_from_excel(self):
+        if self.auto_ws is None:
+            logger.error("Automated sheet not loaded, call reset_excel_template first")
+            return None, None
+
+        # self.wb keeps formulas as text for saving, so read cached values in streaming read-only mode
         try:
-            df = pd.read_excel(self.excel_file, sheet_name=self.auto_ws.title, engine="openpyxl")
-            df.columns = df.columns.str.strip().str.lower()
-            self.mapping_df = df
+            values_wb = load_workbook(self.excel_file, read_only=True, data_only=True)
+            try:
+                rows = iter(list(values_wb[self.auto_ws.title].iter_rows(min_row=1, values_only=True)))
+            finally:
+                values_wb.close()
         except Exception as e:
             logger.error(f"Failed to read workbook: {e}")
             return None, None
 
+        header = next(rows, None)
+        if header is None:
+            raise KeyError("Mapping table is empty.")
+
+        columns = [str(col).strip().lower() if col is not None else "" for col in header]
+
         # Validate required columns
         required_cols = ['sender', 'subject', 'attachment', 'savename', 'status']
-        missing = [col for col in required_cols if col not in df.columns]
+        missing = [col for col in required_cols if col not in columns]
         if missing:
             raise KeyError(f"Missing required columns in mapping table: {', '.join(missing)}")
 
-        mapping_dict = {}
+        # Pull the four mapping fields out of each row tuple in a single C-level call
+        get_fields = itemgetter(
+            columns.index('sender'),
+            columns.index('subject'),
+            columns.index('attachment'),
+            columns.index('savename')
+        )
+        self.status_col_idx = columns.index('status') + 1  # openpyxl columns are 1-indexed
+
+        attachment_patterns = []
+        save_paths = []
+        row_indices = []
+        key_indexes = {}
+
+        for idx, (sender, subject, attachment, savename) in enumerate(map(get_fields, rows)):
+            if sender is None and subject is None and attachment is None and savename is None:
+                continue
 
-        for idx, row in df.iterrows():
             key = (
-                str(row['sender']).lower().strip(),
-                str(row['subject']).lower().strip()
+                sys.intern(str(sender).lower().strip()),
+                sys.intern(str(subject).lower().strip())
             )
-            value = {
-                'AttachmentPattern': str(row['attachment']).lower().strip(),
-                'SaveName': str(row['savename']).strip(),
-                'RowIndex': idx
-            }
-            mapping_dict.setdefault(key, []).append(value)
-            self.mapping_dict = mapping_dict
 
-        logger.info(f"Mapping dictionary created successfully: {len(mapping_dict)} unique keys.")
+            # One parallel array per field; each key only keeps positions into them
+            key_indexes.setdefault(key, []).append(len(row_indices))
+            attachment_patterns.append(str(attachment).lower().strip())
+            save_paths.append(os.path.join(self.archive_folder, SANITIZE_RE.sub('_', str(savename).strip())))
+            row_indices.append(idx)
+
+        self.save_paths = save_paths
+        self.row_indices = row_indices
+
+        mapping_idx = {
+            key: RestatementProcessor._compile_attachment_patterns(indexes, attachment_patterns)
+            for key, indexes in key_indexes.items()
+        }
+        self.mapping_idx = mapping_idx
 
-        return df, mapping_dict
+        logger.info(f"Mapping dictionary created successfully: {len(mapping_idx)} unique keys.")
+
+        return columns, mapping_idx
 
 
     def connect_outlook(self, folder_name=None, folder_type=None):
@@ -251,57 +420,181 @@ class RestatementProcessor:
 
         filter_time = get_filter_time_func()
 
-        filter_str = f"[ReceivedTime] >= '{filter_time.strftime('%m/%d/%Y %H:%M %p')}'"
+        # DASL lets the store reject old messages and messages without attachments; it compares dates in UTC
+        filter_utc = filter_time.astimezone(pytz.utc)
+        filter_str = (
+            f"@SQL=\"urn:schemas:httpmail:datereceived\" >= '{filter_utc.strftime('%m/%d/%Y %I:%M %p')}'"
+            f" AND \"urn:schemas:httpmail:hasattachment\" = 1"
+        )
         items = self.folder.Items.Restrict(filter_str)
         items.Sort("[ReceivedTime]", True)
         self.items = items
 
-        logger.info(f"Retrieved {len(items)} messages from Outlook folder: {self.folder.Name}")
+        logger.info(f"Retrieved {items.Count} messages from Outlook folder: {self.folder.Name}")
 
         return items
 
 
-    def match_and_save_attachments(self):
-        if self.items is None:
-            raise ValueError("Folder items haven't been retrieved, call get_items first")
+    @staticmethod
+    def _path_key(path):
+        # NTFS is case-insensitive, so Stmt.csv and stmt.csv name the same file
+        return os.path.normcase(os.path.abspath(path))
+
+
+    @staticmethod
+    def _save_attachment(stream, save_paths, earlier_saves):
+        # Earlier saves to any of these files finish first, so the last successful write wins as in a serial loop
+        wait(earlier_saves)
+
+        save_path = save_paths[0]
+
+        pythoncom.CoInitialize()
+        try:
+            attachment = win32com.client.Dispatch(
+                pythoncom.CoGetInterfaceAndReleaseStream(stream, pythoncom.IID_IDispatch)
+            )
+            attachment.SaveAsFile(save_path)
+            attachment = None  # Release before the apartment is torn down
+        finally:
+            pythoncom.CoUninitialize()
+
+        # Further rows matching the same attachment get a disk copy instead of another SaveAsFile
+        saved_paths = [save_path]
+        for target in save_paths[1:]:
+            try:
+                shutil.copyfile(save_path, target)
+            except OSError as copy_error:
+                logger.error("Error copying %s to %s: %s", save_path, target, copy_error)
+                continue
+            saved_paths.append(target)
+
+        return saved_paths
+
+
+    def _submit_save(self, executor, attachment, targets):
+        # targets maps each destination's path key to (save_path, [row_idx, ...])
+        pending_saves = self._pending_saves
+        pending_saves.acquire()
+        try:
+            # Marshal the attachment once so a worker thread's apartment can call SaveAsFile
+            stream = pythoncom.CoMarshalInterThreadInterfaceInStream(pythoncom.IID_IDispatch, attachment._oleobj_)
+
+            path_futures = self._path_futures
+            earlier_saves = {path_futures[path_key] for path_key in targets if path_key in path_futures}
+            future = executor.submit(
+                RestatementProcessor._save_attachment,
+                stream,
+                [save_path for save_path, _ in targets.values()],
+                earlier_saves
+            )
+        except Exception:
+            pending_saves.release()
+            raise
+
+        # Releasing on completion bounds how many attachments (and their items) are held open at once
+        future.add_done_callback(lambda _: pending_saves.release())
 
+        for path_key in targets:
+            path_futures[path_key] = future
+
+        return future
+
+
+    @staticmethod
+    def _collect_saves(save_futures):
         updates = {}
 
-        for i, message in enumerate(self.items):
+        for future, targets, i in save_futures:
             try:
-                if message.Class == OutlookMAPIType.MAIL.value and message.Attachments.Count > 0:
-                    sender = str(message.SenderEmailAddress).lower().strip()
-                    subject = str(message.Subject).lower().strip()
-                    key = (sender, subject)
-                    possible_matches = self.mapping_dict.get(key, [])
+                saved_paths = future.result()
+            except Exception as save_error:
+                logger.error("Error saving attachment for message %d: %s", i, save_error)
+                continue
 
-                    logger.info(f"Processing message {i}: {sender} - {subject}")
+            rows_by_path = {save_path: rows for save_path, rows in targets.values()}
+            for save_path in saved_paths:
+                logger.info("Saved: %s", save_path)
 
-                    for attachment in message.Attachments:
-                        attachment_name = str(attachment.FileName).lower().strip()
-                        matched = False
+                for row_idx in rows_by_path[save_path]:
+                    updates[row_idx] = {
+                        'Status': 'Saved'
+                    }
 
-                        for match in possible_matches:
-                            if fnmatch.fnmatch(attachment_name, match['AttachmentPattern']):
-                                safe_name = re.sub(r'[<>:"/\\|?*]', '_', match['SaveName'])
-                                save_path = os.path.join(self.archive_folder, safe_name)
-                                attachment.SaveAsFile(save_path)
+        return updates
 
-                                logger.info(f"Saved: {save_path}")
 
-                                updates[match['RowIndex']] = {
-                                    'Status': 'Saved'
-                                }
+    def match_and_save_attachments(self):
+        if self.items is None:
+            raise ValueError("Folder items haven't been retrieved, call get_items first")
 
-                                matched = True
+        save_futures = []
+        processed = 0
+
+        # Local bindings skip the attribute lookup on every call in the loop
+        lower = str.lower
+        strip = str.strip
+        get_entry = self.mapping_idx.get
+        save_paths = self.save_paths
+        row_indices = self.row_indices
+        path_key = RestatementProcessor._path_key
+
+        # Saves start as messages are walked, with at most MAX_PENDING_SAVES attachments held at a time
+        self._pending_saves = threading.BoundedSemaphore(MAX_PENDING_SAVES)
+        self._path_futures = {}
+        executor = ThreadPoolExecutor(max_workers=SAVE_WORKERS)
+
+        # GetFirst/GetNext walks the collection without pywin32's per-item enumerator wrapping
+        items = self.items
+        message = items.GetFirst()
+
+        while message is not None:
+            i = processed
+            processed += 1
+            try:
+                if message.Class != OutlookMAPIType.MAIL.value:
+                    continue
 
-                        if not matched:
-                            logger.info(f"No match for: {sender}, {subject}, {attachment_name}")
+                sender = strip(lower(message.SenderEmailAddress or ""))
+                subject = strip(lower(message.Subject or ""))
+                key = (sender, subject)
+                entry = get_entry(key)
+
+                # Only messages with a mapping entry are worth touching for their attachments
+                if entry is None:
+                    continue
+
+                if message.Attachments.Count > 0:
+                    logger.debug("Processing message %d: %s - %s", i, sender, subject)
+
+                    for attachment in message.Attachments:
+                        attachment_name = strip(lower(attachment.FileName or ""))
+                        positions = RestatementProcessor._find_matches(entry, attachment_name)
+
+                        if positions:
+                            targets = {}
+                            for pos in positions:
+                                save_path = save_paths[pos]
+                                target = targets.setdefault(path_key(save_path), (save_path, []))
+                                target[1].append(row_indices[pos])
+
+                            future = self._submit_save(executor, attachment, targets)
+                            save_futures.append((future, targets, i))
+                        else:
+                            logger.debug("No match for: %s, %s, %s", sender, subject, attachment_name)
 
             except Exception as emsg_error:
-                logger.error(f"Error processing message {i}: {emsg_error}")
+                logger.error("Error processing message %d: %s", i, emsg_error)
+            finally:
+                message = items.GetNext()
+
+        executor.shutdown(wait=True)
+        self._pending_saves = None
+        self._path_futures = None
+
+        updates = RestatementProcessor._collect_saves(save_futures)
 
         self.excel_doc_updates = updates
+        self.messages_processed = processed
 
         logger.info(f"Emails Processed, Total attachments saved: {len(self.excel_doc_updates)}")
 
@@ -312,15 +605,21 @@ class RestatementProcessor:
         if  self.excel_doc_updates is None:
             raise ValueError("Attachments haven't been saved, call match_and_save_attachments first")
 
-        for idx, update in self.excel_doc_updates.items():
-            excel_row = idx + 2  # +2 because Excel is 1-indexed and row 1 is header
-            if 'Status' in update:
-                status_col = self.mapping_df.columns.get_loc('Status') + 1
-                self.auto_ws.cell(row=excel_row, column=status_col).value = update['Status']
+        # Collect the status column first, then write it top to bottom in one pass
+        statuses = sorted(
+            (idx + 2, update['Status'])  # +2 because Excel is 1-indexed and row 1 is header
+            for idx, update in self.excel_doc_updates.items()
+            if 'Status' in update
+        )
+
+        ws_cell = self.auto_ws.cell
+        status_col = self.status_col_idx
+        for excel_row, status in statuses:
+            ws_cell(row=excel_row, column=status_col, value=status)
 
         logger.info("Excel status and comments updated successfully.")
 
-        named_cells = RestatementProcessor._get_named_cell_value(self.wb)
+        named_cells = self._named_cells
 
         named_cells["End_Time"].value = script_end.strftime("%Y-%m-%d %H:%M:%S")
         named_cells["Execution_Time"].value = str(duration).split('.')[0]
@@ -343,11 +642,14 @@ class RestatementProcessor:
             except Exception as com_error:
                 logger.error("Error during COM uninitialization: %s", com_error)
 
-            # Release workbook and DataFrame
+            # Release workbook and mapping table
             self.wb = None
             self.auto_ws = None
-            self.mapping_df = None
-            self.mapping_dict = None
+            self._named_cells = None
+            self.status_col_idx = None
+            self.mapping_idx = None
+            self.save_paths = None
+            self.row_indices = None
 
             gc.collect()
             logger.info("Processor cleanup completed.")
@@ -377,10 +679,10 @@ def main():
 
         logger.info("Script execution started.")
 
-        processor = RestatementProcessor(EXCEL_FILE, SHARED_MAILBOX, save_dir)
+        processor = RestatementProcessor(CONFIG.excel_file, CONFIG.shared_mailbox, save_dir)
         processor.reset_excel_template(cbd, pbd, p2bd, script_start)
         processor.build_dictionary_from_excel()
-        processor.connect_outlook(folder_name=FOLDER_NAME, folder_type=OutlookFolderName.CUSTOM)
+        processor.connect_outlook(folder_name=CONFIG.folder_name, folder_type=OutlookFolderName.CUSTOM)
         processor.get_items(get_filter_time(pbd, hour=16, minute=0, timezone="US/Eastern"))
         processor.match_and_save_attachments()
 
@@ -391,10 +693,10 @@ def main():
         processor.update_excel_status(script_end, duration)
 
         # Summary output
-        logger.info(f"Processed {len(processor.items)} messages.")
+        logger.info(f"Processed {processor.messages_processed} messages.")
         logger.info(f"Saved {len(processor.excel_doc_updates)} attachments.")
 
-        print(f"Processed {len(processor.items)} messages. Saved {len(processor.excel_doc_updates)} attachments.")
+        print(f"Processed {processor.messages_processed} messages. Saved {len(processor.excel_doc_updates)} attachments.")
 
     except Exception as e:
         error_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -406,7 +708,7 @@ def main():
     finally:
         logger.info("Starting cleanup...")
 
-        if 'processor' is not None:
+        if processor is not None:
             processor.cleanup()
 
 # ------------------------------------------------- Main Function Call -------------------------------------------------